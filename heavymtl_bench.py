@@ -0,0 +1,740 @@
+import os
+import argparse
+import json
+import logging
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+import heavymtl
+
+# Bump when the generated data changes, so results from different corpora aren't compared as like for like
+CORPUS_VERSION = 1
+CORPUS_MANIFEST = "corpus.json"
+CHUNK_ROWS = 500000  # Rows generated and written per chunk, keeps generation memory flat at 10M+ rows
+
+# Event window the synthetic timestamps fall in
+TIME_START = np.datetime64("2025-11-01T00:00:00", "ns")
+TIME_SPAN_SECONDS = 45 * 24 * 3600
+
+DEFAULT_USERS = ["alice", "bob", "carol", "dave", "erin"]
+EXECUTABLES = ["CHROME.EXE", "SVCHOST.EXE", "POWERSHELL.EXE", "CMD.EXE", "EXPLORER.EXE", "OUTLOOK.EXE",
+               "WINWORD.EXE", "RUNDLL32.EXE", "MSEDGE.EXE", "TEAMS.EXE", "PSEXESVC.EXE", "CONHOST.EXE"]
+FOLDERS = ["Windows\\System32", "Windows\\SysWOW64", "Program Files\\Google\\Chrome\\Application",
+           "Program Files\\Microsoft Office\\root\\Office16", "Users\\{user}\\Downloads", "Users\\{user}\\Documents",
+           "Users\\{user}\\AppData\\Local\\Temp", "Users\\{user}\\Desktop", "ProgramData\\Microsoft\\Windows Defender"]
+DOCUMENTS = ["report", "invoice", "notes", "budget", "passwords", "setup", "vpn", "backup", "scan", "draft"]
+EXTENSIONS = [".docx", ".xlsx", ".pdf", ".txt", ".zip", ".exe", ".ps1", ".lnk", ".dll", ".log"]
+
+# (EventId, Channel, Provider, MapDescription) pairs seen in the bundled queries and a typical Security/System log
+EVENTS = [
+    (4624, "Security", "Microsoft-Windows-Security-Auditing", "Successful logon"),
+    (4625, "Security", "Microsoft-Windows-Security-Auditing", "An account failed to log on"),
+    (4634, "Security", "Microsoft-Windows-Security-Auditing", "An account was logged off"),
+    (4672, "Security", "Microsoft-Windows-Security-Auditing", "Special privileges assigned to new logon"),
+    (4688, "Security", "Microsoft-Windows-Security-Auditing", "A new process has been created"),
+    (4720, "Security", "Microsoft-Windows-Security-Auditing", "A user account was created"),
+    (1102, "Security", "Microsoft-Windows-Eventlog", "The audit log was cleared"),
+    (7045, "System", "Service Control Manager", "A service was installed in the system"),
+    (7036, "System", "Service Control Manager", "Service entered the running/stopped state"),
+    (4104, "Microsoft-Windows-PowerShell/Operational", "Microsoft-Windows-PowerShell", "Script block logging"),
+    (21, "Microsoft-Windows-TerminalServices-LocalSessionManager/Operational",
+     "Microsoft-Windows-TerminalServices-LocalSessionManager", "Remote Desktop Services: Session logon succeeded"),
+    (1116, "Microsoft-Windows-Windows Defender/Operational", "Microsoft-Windows-Windows Defender",
+     "Malware detected"),
+]
+
+def blank_out(rng, values, blank):
+    """Replace a fraction of values with None (an empty CSV cell)."""
+    if blank:
+        values = values.astype(object)
+        values[rng.random(len(values)) < blank] = None
+    return values
+
+def stamp(blank=0.0):
+    """Random timestamps in the event window."""
+    def generate(rng, n, ctx, cols):
+        values = pd.Series(TIME_START + rng.integers(0, TIME_SPAN_SECONDS * 10 ** 9, n).astype("timedelta64[ns]"))
+        if blank:
+            values[rng.random(n) < blank] = pd.NaT
+        return values
+    return generate
+
+def near(column, same=0.6, blank=0.0):
+    """Timestamps equal to another time column's for a fraction of rows (so they group into one event), else up to a
+    week later."""
+    def generate(rng, n, ctx, cols):
+        base = cols[column]
+        later = base + pd.to_timedelta(rng.integers(1, 7 * 24 * 3600, n), unit="s")
+        values = base.where(rng.random(n) < same, later)
+        if blank:
+            values[rng.random(n) < blank] = pd.NaT
+        return values
+    return generate
+
+def format_times(values):
+    """Format timestamps the way EZTools writes them (7 fractional digits), blank for NaT. numpy's ISO formatting is
+    about 10x faster than strftime, which dominated generation time at millions of rows."""
+    text = np.datetime_as_string(values.to_numpy(dtype="datetime64[us]"))
+    text = np.char.add(np.char.replace(text, "T", " "), "0").astype(object)
+    text[values.isna().to_numpy()] = None
+    return text
+
+def extension_of(column):
+    """The extension of another column's file names."""
+    def generate(rng, n, ctx, cols):
+        return pd.Series(cols[column]).str.extract(r"(\.[^.]+)$", expand=False).to_numpy(dtype=object)
+    return generate
+
+def pick(values, blank=0.0):
+    """Random choice from a fixed list."""
+    values = np.array(values, dtype=object)
+
+    def generate(rng, n, ctx, cols):
+        return blank_out(rng, values[rng.integers(0, len(values), n)], blank)
+    return generate
+
+def number(low, high, blank=0.0):
+    """Random integers in [low, high)."""
+    def generate(rng, n, ctx, cols):
+        return blank_out(rng, rng.integers(low, high, n), blank)
+    return generate
+
+def counter():
+    """Running row number across chunks, like an EntryNumber or RecordNumber."""
+    def generate(rng, n, ctx, cols):
+        return np.arange(ctx["offset"], ctx["offset"] + n)
+    return generate
+
+def const(value):
+    """The same value on every row."""
+    def generate(rng, n, ctx, cols):
+        return np.full(n, value, dtype=object)
+    return generate
+
+def pooled(make, size=2000, blank=0.0):
+    """Random choice from a pool of size values built by make(rng, ctx), for strings too costly to format per row."""
+    def generate(rng, n, ctx, cols):
+        pool = np.array([make(rng, ctx) for _ in range(size)], dtype=object)
+        return blank_out(rng, pool[rng.integers(0, size, n)], blank)
+    return generate
+
+def random_user(rng, ctx):
+    return ctx["user"] or ctx["users"][rng.integers(len(ctx["users"]))]
+
+def random_file(rng, ctx):
+    return f"{DOCUMENTS[rng.integers(len(DOCUMENTS))]}{rng.integers(1000)}{EXTENSIONS[rng.integers(len(EXTENSIONS))]}"
+
+def random_folder(rng, ctx):
+    return "C:\\" + FOLDERS[rng.integers(len(FOLDERS))].format(user=random_user(rng, ctx))
+
+def random_path(rng, ctx):
+    return f"{random_folder(rng, ctx)}\\{random_file(rng, ctx)}"
+
+def random_executable(rng, ctx):
+    return f"{random_folder(rng, ctx)}\\{EXECUTABLES[rng.integers(len(EXECUTABLES))].lower()}"
+
+def random_sid(rng, ctx):
+    return ctx["sids"][random_user(rng, ctx)]
+
+def random_hash(rng, ctx):
+    return rng.bytes(20).hex()
+
+def user_columns(blank=0.1):
+    """SRUM UserName and Sid columns for the same random user, each occasionally blank."""
+    def user_name(rng, n, ctx, cols):
+        return blank_out(rng, np.array(ctx["users"], dtype=object)[rng.integers(0, len(ctx["users"]), n)], blank)
+
+    def sid(rng, n, ctx, cols):
+        sids = pd.Series(cols["UserName"]).map(ctx["sids"]).to_numpy(dtype=object)
+        return blank_out(rng, sids, blank)
+    return {"UserName": user_name, "Sid": sid}
+
+def evtx_columns():
+    """EvtxECmd columns with EventId, Channel, Provider and MapDescription drawn as one consistent event."""
+    events = pd.DataFrame(EVENTS, columns=["EventId", "Channel", "Provider", "MapDescription"])
+
+    def event(column):
+        def generate(rng, n, ctx, cols):
+            if "event" not in ctx:
+                ctx["event"] = rng.integers(0, len(events), n)
+            return events[column].to_numpy(dtype=object)[ctx["event"]]
+        return generate
+
+    def computer(rng, n, ctx, cols):
+        return np.full(n, f"{ctx['host']}.corp.local", dtype=object)
+    return {
+        "RecordNumber": counter(),
+        "EventRecordId": counter(),
+        "TimeCreated": stamp(),
+        "EventId": event("EventId"),
+        "Level": pick(["Info", "Warning", "Error", "LogAlways"]),
+        "Provider": event("Provider"),
+        "Channel": event("Channel"),
+        "ProcessId": number(4, 20000),
+        "ThreadId": number(4, 20000),
+        "Computer": computer,
+        "UserId": pooled(random_sid, blank=0.3),
+        "MapDescription": event("MapDescription"),
+        "UserName": pooled(lambda rng, ctx: f"CORP\\{random_user(rng, ctx)}", blank=0.4),
+        "RemoteHost": pooled(lambda rng, ctx: f"10.0.{rng.integers(256)}.{rng.integers(256)} (WS{rng.integers(100):02d})",
+                             blank=0.7),
+        "PayloadData1": pooled(lambda rng, ctx: f"Target: CORP\\{random_user(rng, ctx)}", blank=0.2),
+        "PayloadData2": pooled(lambda rng, ctx: f"LogonType {rng.integers(2, 11)}", blank=0.4),
+        "PayloadData3": pooled(random_executable, blank=0.6),
+        "PayloadData4": pick([None, "Elevated: Yes", "Elevated: No"]),
+        "PayloadData5": pick([None]),
+        "PayloadData6": pick([None]),
+        "ExecutableInfo": pooled(lambda rng, ctx: f"\"{random_executable(rng, ctx)}\" -nop -w hidden", blank=0.7),
+        "HiddenRecord": pick(["False"]),
+        "SourceFile": pick(["C:\\Windows\\System32\\winevt\\Logs\\Security.evtx",
+                            "C:\\Windows\\System32\\winevt\\Logs\\System.evtx"]),
+        "Keywords": pick(["Audit success", "Audit failure", "Classic"]),
+        "ExtraDataOffset": number(0, 4096),
+        "Payload": pooled(lambda rng, ctx: json.dumps({"EventData": {"Data": [
+            {"@Name": "SubjectUserName", "#text": random_user(rng, ctx)},
+            {"@Name": "NewProcessName", "#text": random_executable(rng, ctx)}
+        ]}}))
+    }
+
+def mft_columns():
+    """MFTECmd $MFT columns; the 0x30 (FILE_NAME) times are often blank or equal to the 0x10 ones."""
+    return {
+        "EntryNumber": counter(),
+        "SequenceNumber": number(1, 20),
+        "InUse": pick(["True", "True", "True", "False"]),
+        "ParentEntryNumber": number(5, 500000),
+        "ParentSequenceNumber": number(1, 20),
+        "ParentPath": pooled(lambda rng, ctx: "." + random_folder(rng, ctx)[2:]),
+        "FileName": pooled(random_file),
+        "Extension": extension_of("FileName"),
+        "FileSize": number(0, 50000000),
+        "ReferenceCount": number(1, 3),
+        "IsDirectory": pick(["False", "False", "False", "True"]),
+        "HasAds": pick(["False"]),
+        "IsAds": pick(["False"]),
+        "SI<FN": pick(["False", "False", "False", "True"]),
+        "Created0x10": stamp(),
+        "Created0x30": near("Created0x10", same=0.8, blank=0.4),
+        "LastModified0x10": near("Created0x10", same=0.5),
+        "LastModified0x30": near("Created0x10", same=0.8, blank=0.4),
+        "LastRecordChange0x10": near("LastModified0x10", same=0.6),
+        "LastRecordChange0x30": near("Created0x10", same=0.8, blank=0.4),
+        "LastAccess0x10": near("LastModified0x10", same=0.3),
+        "LastAccess0x30": near("Created0x10", same=0.8, blank=0.4),
+        "UpdateSequenceNumber": number(0, 10 ** 9),
+        "LogfileSequenceNumber": number(0, 10 ** 10),
+        "SecurityId": number(256, 3000),
+        "ZoneIdContents": pick([None, None, None, "[ZoneTransfer] ZoneId=3"]),
+        "SiFlags": pick(["Archive", "Hidden|System", "Archive|NotContentIndexed"]),
+        "NameType": pick(["Windows", "DosWindows", "Posix"])
+    }
+
+def usn_columns():
+    """MFTECmd $J (USN journal) columns."""
+    return {
+        "Name": pooled(random_file),
+        "Extension": extension_of("Name"),
+        "EntryNumber": number(0, 500000),
+        "SequenceNumber": number(1, 20),
+        "ParentEntryNumber": number(5, 500000),
+        "ParentSequenceNumber": number(1, 20),
+        "ParentPath": pooled(lambda rng, ctx: "." + random_folder(rng, ctx)[2:]),
+        "UpdateSequenceNumber": counter(),
+        "UpdateTimestamp": stamp(),
+        "UpdateReasons": pick(["FileCreate", "DataExtend|DataOverwrite", "FileDelete|Close", "RenameNewName",
+                               "BasicInfoChange|Close", "SecurityChange"]),
+        "FileAttributes": pick(["Archive", "Hidden|System|Archive", "Directory"]),
+        "OffsetToData": number(0, 10 ** 9),
+        "SourceFile": const("C:\\$Extend\\$UsnJrnl:$J")
+    }
+
+def shellbag_columns():
+    """SBECmd ShellBag columns (one file per user hive)."""
+    return {
+        "BagPath": pooled(lambda rng, ctx: f"BagMRU\\{rng.integers(10)}\\{rng.integers(10)}"),
+        "Slot": number(0, 50),
+        "NodeSlot": number(0, 300),
+        "MRUPosition": number(0, 30),
+        "AbsolutePath": pooled(lambda rng, ctx: "My Computer\\" + random_folder(rng, ctx)),
+        "ShellType": pick(["Directory", "Drive letter", "Root folder: GUID", "Network location"]),
+        "Value": pooled(random_file),
+        "ChildBags": number(0, 10),
+        "CreatedOn": stamp(blank=0.3),
+        "ModifiedOn": stamp(blank=0.3),
+        "AccessedOn": stamp(blank=0.3),
+        "LastWriteTime": stamp(blank=0.1),
+        "FirstInteracted": stamp(blank=0.8),
+        "LastInteracted": stamp(blank=0.8),
+        "HasExplored": pick(["True", "False"]),
+        "Miscellaneous": pick([None, "NTFS file system"])
+    }
+
+def link_columns():
+    """LECmd / JLECmd source timestamps, which match each other for most files."""
+    return {
+        "SourceCreated": stamp(),
+        "SourceModified": near("SourceCreated", same=0.6),
+        "SourceAccessed": near("SourceModified", same=0.5)
+    }
+
+def recmd_columns(time_column, **extra):
+    """Columns of an RECmd batch plugin output with its last-executed style time column."""
+    return dict({
+        "HivePath": pooled(lambda rng, ctx: f"C:\\Users\\{random_user(rng, ctx)}\\NTUSER.DAT"),
+        "HiveType": const("NtUser"),
+        "KeyPath": pooled(lambda rng, ctx: f"Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\{random_file(rng, ctx)}"),
+        "ValueName": pooled(random_file),
+        time_column: stamp(blank=0.05)
+    }, **extra)
+
+# One entry per CSV_MAPPINGS key: the KAPE module folder, file names ({user} files are written once per user), share of
+# the corpus rows, and column name -> generator in the order EZTools writes them
+ARTIFACTS = {
+    "*_Activity_PackageIDs.csv": {
+        "folder": "FileFolderAccess", "names": ["{user}_Activity_PackageIDs.csv"], "weight": 0.005,
+        "columns": {
+            "Id": pooled(lambda rng, ctx: f"{rng.integers(16 ** 8):08x}-{rng.integers(16 ** 4):04x}"),
+            "Platform": pick(["x_exe_path", "windows_win32", "packageId"]),
+            "Name": pooled(random_executable),
+            "AdditionalInformation": pick([None]),
+            "Expires": stamp(blank=0.05)
+        }
+    },
+    "*_RBCmd_Output.csv": {
+        "folder": "FileDeletion", "names": ["RBCmd_Output.csv"], "weight": 0.005,
+        "columns": {
+            "SourceName": pooled(lambda rng, ctx: f"C:\\$Recycle.Bin\\{random_sid(rng, ctx)}\\$I{rng.integers(16 ** 6):06X}.txt"),
+            "FileType": pick(["$I"]),
+            "FileName": pooled(random_path),
+            "FileSize": number(0, 10 ** 7),
+            "DeletedOn": stamp()
+        }
+    },
+    "*_NTUSER.csv": {
+        "folder": "FileFolderAccess", "names": ["{user}_NTUSER.csv"], "weight": 0.01, "columns": shellbag_columns()
+    },
+    "*_UsrClass.csv": {
+        "folder": "FileFolderAccess", "names": ["{user}_UsrClass.csv"], "weight": 0.01, "columns": shellbag_columns()
+    },
+    "*_PECmd_Output.csv": {
+        "folder": "ProgramExecution", "names": ["PECmd_Output.csv"], "weight": 0.01,
+        "columns": dict({
+            "Note": pick([None]),
+            "SourceFilename": pooled(lambda rng, ctx: f"C:\\Windows\\Prefetch\\{EXECUTABLES[rng.integers(len(EXECUTABLES))]}-{rng.integers(16 ** 8):08X}.pf"),
+            "SourceCreated": stamp(),
+            "SourceModified": stamp(),
+            "SourceAccessed": stamp(),
+            "ExecutableName": pick(EXECUTABLES),
+            "Hash": pooled(lambda rng, ctx: f"{rng.integers(16 ** 8):08X}"),
+            "Size": number(1000, 200000),
+            "Version": const("Windows 10 or Windows 11"),
+            "RunCount": number(1, 500),
+            "LastRun": stamp(),
+        }, **{f"PreviousRun{i}": stamp(blank=0.2 + 0.1 * i) for i in range(7)}, **{
+            "Volume0Name": pooled(lambda rng, ctx: f"\\VOLUME{{{rng.integers(16 ** 8):08x}}}", blank=0.1),
+            "Volume0Serial": pooled(lambda rng, ctx: f"{rng.integers(16 ** 8):08X}"),
+            "Volume0Created": stamp(),
+            "Directories": pooled(random_folder),
+            "FilesLoaded": pooled(lambda rng, ctx: ", ".join(random_path(rng, ctx) for _ in range(5))),
+            "ParsingError": pick(["False"])
+        })
+    },
+    "*_*Destinations.csv": {
+        "folder": "FileFolderAccess", "names": ["AutomaticDestinations.csv", "CustomDestinations.csv"],
+        "weight": 0.01,
+        "columns": dict({"SourceFile": pooled(
+            lambda rng, ctx: f"C:\\Users\\{random_user(rng, ctx)}\\AppData\\Roaming\\Microsoft\\Windows\\Recent\\"
+                             f"AutomaticDestinations\\{rng.bytes(8).hex()}.automaticDestinations-ms")},
+            **link_columns(), **{
+                "AppId": pooled(lambda rng, ctx: f"{rng.bytes(8).hex()}"),
+                "AppIdDescription": pick(["Microsoft Word", "Windows Explorer", "Notepad", None]),
+                "EntryNumber": number(1, 200),
+                "LocalPath": pooled(random_path, blank=0.1),
+                "Arguments": pick([None, None, "-ExecutionPolicy Bypass", "/c whoami"]),
+                "MachineID": pooled(lambda rng, ctx: ctx["host"].lower())
+            })
+    },
+    "*_LECmd_Output.csv": {
+        "folder": "FileFolderAccess", "names": ["LECmd_Output.csv"], "weight": 0.01,
+        "columns": dict({"SourceFile": pooled(
+            lambda rng, ctx: f"C:\\Users\\{random_user(rng, ctx)}\\AppData\\Roaming\\Microsoft\\Windows\\Recent\\"
+                             f"{random_file(rng, ctx)}.lnk")},
+            **link_columns(), **{
+                "TargetCreated": stamp(blank=0.1),
+                "TargetModified": stamp(blank=0.1),
+                "TargetAccessed": stamp(blank=0.1),
+                "FileSize": number(0, 10 ** 7),
+                "RelativePath": pooled(lambda rng, ctx: "..\\..\\" + random_file(rng, ctx), blank=0.3),
+                "WorkingDirectory": pooled(random_folder, blank=0.3),
+                "LocalPath": pooled(random_path, blank=0.1),
+                "Arguments": pick([None, None, "-ExecutionPolicy Bypass", "/c whoami"]),
+                "MachineID": pooled(lambda rng, ctx: ctx["host"].lower())
+            })
+    },
+    "*_SrumECmd_*.csv": {
+        "folder": "SRUMDatabase",
+        "names": ["SrumECmd_AppResourceUseInfo_Output.csv", "SrumECmd_NetworkUsages_Output.csv",
+                  "SrumECmd_NetworkConnections_Output.csv", "SrumECmd_PushNotifications_Output.csv"],
+        "weight": 0.02,
+        "columns": dict({
+            "Id": counter(),
+            "Timestamp": stamp(),
+            "ExeInfo": pooled(random_executable),
+            "ExeInfoDescription": pick([None, "Google Chrome", "Windows PowerShell"]),
+            "ExeTimestamp": stamp(blank=0.5),
+            "SidType": pick(["LocalSystem", "UnknownOrUserSid", "LocalService"])
+        }, **user_columns(), **{
+            "BytesReceived": number(0, 10 ** 9),
+            "BytesSent": number(0, 10 ** 9),
+            "InterfaceLuid": number(10 ** 15, 10 ** 16),
+            "L2ProfileId": number(0, 300)
+        })
+    },
+    "*_MFTECmd_\\$J_Output.csv": {
+        "folder": "FileSystem", "names": ["MFTECmd_$J_Output.csv"], "weight": 0.30, "columns": usn_columns()
+    },
+    "*_MFTECmd_\\$MFT_Output.csv": {
+        "folder": "FileSystem", "names": ["MFTECmd_$MFT_Output.csv"], "weight": 0.33, "columns": mft_columns()
+    },
+    "*_SumECmd_DETAIL_ClientDetailed_Output.csv": {
+        "folder": "SUMDatabase", "names": ["SumECmd_DETAIL_ClientDetailed_Output.csv"], "weight": 0.005,
+        "columns": {
+            "RoleGuid": pick(["10a9226f-50ee-49d8-a393-9a501d47ce04", "ad495fc3-0eaa-413d-ba7d-8b13fa7ec598"]),
+            "Description": pick(["File Server", "Active Directory Domain Services"]),
+            "TenantId": const("5fce5c46-97d9-4d8a-a1b0-fb0f2a55a1b4"),
+            "TotalAccesses": number(1, 5000),
+            "InsertDate": stamp(),
+            "LastAccess": near("InsertDate", same=0.3),
+            "IpAddress": pooled(lambda rng, ctx: f"10.0.{rng.integers(256)}.{rng.integers(256)}", blank=0.05),
+            "AuthenticatedUserName": pooled(lambda rng, ctx: f"corp\\{random_user(rng, ctx)}", blank=0.05),
+            "ClientName": pooled(lambda rng, ctx: f"ws{rng.integers(100):02d}.corp.local")
+        }
+    },
+    "*_RecentFileCacheParser_Output.csv": {
+        "folder": "ProgramExecution", "names": ["RecentFileCacheParser_Output.csv"], "weight": 0.002,
+        "columns": dict({"SourceFile": const("C:\\Windows\\AppCompat\\Programs\\RecentFileCache.bcf")},
+                        **link_columns(), **{"FileName": pooled(random_executable)})
+    },
+    "*_Amcache_*FileEntries.csv": {
+        "folder": "ProgramExecution",
+        "names": ["Amcache_AssociatedFileEntries.csv", "Amcache_UnassociatedFileEntries.csv"], "weight": 0.02,
+        "columns": {
+            "ProgramName": pick(["Unassociated", "Google Chrome", "Microsoft Office"]),
+            "ProgramID": pooled(lambda rng, ctx: f"{rng.integers(16 ** 12):012x}"),
+            "VolumeID": pooled(lambda rng, ctx: f"{{{rng.integers(16 ** 8):08x}}}"),
+            "FileKeyLastWriteTimestamp": stamp(),
+            "SHA1": pooled(random_hash),
+            "IsOsComponent": pick(["True", "False"]),
+            "FullPath": pooled(random_executable),
+            "Name": pick([name.lower() for name in EXECUTABLES]),
+            "FileExtension": const(".exe"),
+            "LinkDate": stamp(blank=0.2),
+            "Size": number(1000, 10 ** 8)
+        }
+    },
+    "*_Windows10Creators_SYSTEM_AppCompatCache.csv": {
+        "folder": "ProgramExecution", "names": ["Windows10Creators_SYSTEM_AppCompatCache.csv"], "weight": 0.005,
+        "columns": {
+            "ControlSet": number(1, 3),
+            "CacheEntryPosition": counter(),
+            "Path": pooled(random_executable),
+            "LastModifiedTimeUTC": stamp(blank=0.05),
+            "Executed": pick(["NA", "Yes", "No"]),
+            "Duplicate": pick(["False"]),
+            "SourceFile": const("C:\\Windows\\System32\\config\\SYSTEM")
+        }
+    },
+    "*_Amcache_*.csv": {
+        "folder": "ProgramExecution",
+        "names": ["Amcache_DeviceContainers.csv", "Amcache_DevicePnps.csv", "Amcache_DriveBinaries.csv",
+                  "Amcache_ShortCuts.csv"],
+        "weight": 0.01,
+        "columns": {
+            "KeyName": pooled(lambda rng, ctx: f"{rng.integers(16 ** 8):08x}"),
+            "KeyLastWriteTimestamp": stamp(),
+            "Manufacturer": pick(["Microsoft", "Intel Corporation", "Realtek", None]),
+            "Model": pick(["Generic USB Hub", "HD Audio", "USB Mass Storage Device", None]),
+            "Description": pooled(random_file)
+        }
+    },
+    "*_EvtxECmd_Output.csv": {
+        "folder": "EventLogs", "names": ["EvtxECmd_Output.csv"], "weight": 0.19, "columns": evtx_columns()
+    },
+    "*_RunMRU__*_Users_*_NTUSER.DAT.csv": {
+        "folder": "Registry", "names": ["RECmd_Batch_RunMRU__C_Users_{user}_NTUSER.DAT.csv"], "weight": 0.002,
+        "columns": {
+            "ValueName": pick(list("abcdefghij")),
+            "MruPosition": number(0, 26),
+            "Executable": pick(["cmd", "powershell", "regedit", "\\\\fileserver\\share", "mstsc"]),
+            "OpenedOn": stamp(blank=0.5),
+            "BatchKeyPath": const("Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\RunMRU")
+        }
+    },
+    "*_RECmd_Batch_UserActivity_Output.csv": {
+        "folder": "Registry", "names": ["RECmd_Batch_UserActivity_Output.csv"], "weight": 0.02,
+        "columns": recmd_columns("LastWriteTimestamp", **{
+            "Description": pick(["RecentDocs", "OpenSaveMRU", "TypedPaths", "WordWheelQuery", "MountPoints2"]),
+            "Category": pick(["User Activity", "File and folder opening"]),
+            "ValueData": pooled(random_path),
+            "ValueData2": pick([None]),
+            "Comment": pick([None])
+        })
+    },
+    "*_UserAssist__*_Users_*_NTUSER.DAT.csv": {
+        "folder": "Registry", "names": ["RECmd_Batch_UserAssist__C_Users_{user}_NTUSER.DAT.csv"], "weight": 0.003,
+        "columns": {
+            "BatchValueName": pooled(lambda rng, ctx: f"{{{rng.integers(16 ** 8):08X}}}"),
+            "ProgramName": pooled(random_executable),
+            "RunCounter": number(0, 300),
+            "FocusCount": number(0, 300),
+            "FocusTime": pooled(lambda rng, ctx: f"{rng.integers(24)}h {rng.integers(60)}m {rng.integers(60)}s"),
+            "LastExecuted": stamp(blank=0.2),
+            "BatchKeyPath": const("Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\UserAssist")
+        }
+    },
+    "*_BamDam__*_Windows_System32_config_SYSTEM.csv": {
+        "folder": "Registry", "names": ["RECmd_Batch_BamDam__C_Windows_System32_config_SYSTEM.csv"], "weight": 0.002,
+        "columns": {
+            "Program": pooled(lambda rng, ctx: "\\Device\\HarddiskVolume3" + random_executable(rng, ctx)[2:]),
+            "ExecutionTime": stamp(),
+            "BatchKeyPath": pooled(lambda rng, ctx: f"ControlSet001\\Services\\bam\\State\\UserSettings\\{random_sid(rng, ctx)}",
+                                   blank=0.05),
+            "BatchValueName": pick(["BAM"])
+        }
+    },
+    "*_RecentDocs__*_Users_*_NTUSER.DAT.csv": {
+        "folder": "Registry", "names": ["RECmd_Batch_RecentDocs__C_Users_{user}_NTUSER.DAT.csv"], "weight": 0.005,
+        "columns": {
+            "BatchValueName": pick(["RecentDocs"]),
+            "Extension": pick(EXTENSIONS),
+            "ValueName": number(0, 150),
+            "Target": pooled(random_file),
+            "LnkName": pooled(lambda rng, ctx: random_file(rng, ctx) + ".lnk"),
+            "MruPosition": number(0, 150),
+            "OpenedOn": stamp(blank=0.5),
+            "ExtensionLastOpened": stamp(blank=0.1)
+        }
+    },
+}
+
+def corpus_files(host, users):
+    """List (relative path, CSV_MAPPINGS key, weight) for each file of one host, checking that every file name is
+    matched to the artifact it was generated for."""
+    missing = set(heavymtl.CSV_MAPPINGS) - set(ARTIFACTS)
+    if missing:
+        raise ValueError(f"No generator for CSV_MAPPINGS entries: {', '.join(sorted(missing))}")
+    files = []
+    for csv_type, artifact in ARTIFACTS.items():
+        names = [name.format(user=user) for name in artifact["names"] for user in users] if any(
+            "{user}" in name for name in artifact["names"]) else artifact["names"]
+        for name in names:
+            filename = f"20251220143000_{name}"
+            if heavymtl.get_csv_type(filename) != csv_type:
+                raise ValueError(f"Generated name {filename} matches {heavymtl.get_csv_type(filename)}, not {csv_type}")
+            files.append((os.path.join(artifact["folder"], filename), csv_type, artifact["weight"] / len(names)))
+    return files
+
+def write_artifact(path, csv_type, rows, host, users, user, rng):
+    """Write one synthetic EZTools CSV of rows rows in CHUNK_ROWS chunks."""
+    columns = ARTIFACTS[csv_type]["columns"]
+    sids = {name: f"S-1-5-21-3623811015-3361044348-30300820-{1001 + i}" for i, name in enumerate(users)}
+    offset = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        while True:
+            n = min(CHUNK_ROWS, rows - offset)
+            ctx = {"host": host, "users": users, "user": user, "sids": sids, "offset": offset}
+            cols = {}
+            for name, generate in columns.items():
+                cols[name] = generate(rng, n, ctx, cols)
+            frame = pd.DataFrame({name: pd.Series(values) for name, values in cols.items()})
+            for name in frame.columns[[pd.api.types.is_datetime64_any_dtype(dtype) for dtype in frame.dtypes]]:
+                frame[name] = format_times(frame[name])
+            frame.to_csv(f, index=False, header=offset == 0, lineterminator="\n")
+            offset += n
+            if offset >= rows:
+                break
+
+def generate_corpus(output_dir, rows, hosts=1, users=None, seed=0):
+    """Generate a KAPE-style EZTools case: Modules folders with every CSV_MAPPINGS artifact, rows split by weight, and
+    a corpus.json manifest describing it."""
+    users = users or DEFAULT_USERS
+    host_names = ["ES01"] if hosts == 1 else [f"HOST{i + 1:02d}" for i in range(hosts)]
+    manifest = {"version": CORPUS_VERSION, "seed": seed, "rows": rows, "users": users, "hosts": {}}
+    for host_index, host in enumerate(host_names):
+        modules_dir = os.path.join(output_dir, host, "Modules") if hosts > 1 else os.path.join(output_dir, "Modules")
+        files = corpus_files(host, users)
+        total_weight = sum(weight for _, _, weight in files)
+        manifest["hosts"][host] = {"input": os.path.relpath(modules_dir, output_dir), "files": []}
+        for file_index, (relative_path, csv_type, weight) in enumerate(files):
+            path = os.path.join(modules_dir, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file_rows = max(1, round(rows / hosts * weight / total_weight))
+            user = next((name for name in users if f"_{name}_" in os.path.basename(path)), None)
+            # Seeded per file, so a file's contents don't depend on the files generated before it
+            rng = np.random.default_rng([seed, host_index, file_index])
+            write_artifact(path, csv_type, file_rows, host, users, user, rng)
+            manifest["hosts"][host]["files"].append(
+                {"path": os.path.relpath(path, output_dir), "artifact": csv_type, "rows": file_rows})
+            logging.info(f"Wrote {file_rows} rows to {path}")
+    with open(os.path.join(output_dir, CORPUS_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def git_commit():
+    """Short commit hash of the heavymtl.py checkout being benchmarked, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(heavymtl.__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def has_timestamps(csv_path, csv_type):
+    """Whether a corpus CSV has a non-blank value in any of the timestamp columns its CSV_MAPPINGS entry reads."""
+    mapping = heavymtl.CSV_MAPPINGS[csv_type]
+    time_cols = [field for field, _ in mapping["time_fields"]] if "time_fields" in mapping else [mapping["time"]]
+    df = heavymtl.read_eztools_csv(csv_path)
+    return any(df[col].fillna("").str.strip().ne("").any() for col in time_cols if col in df)
+
+def benchmark_artifacts(manifest, corpus_dir, repeat):
+    """Time parse_csv_to_tln on every corpus file (best of repeat runs) and total the rows/sec per artifact.
+
+    A failed parse raises, as does an empty timeline from a file with timestamps, since timing a parser that fails early
+    would report a bogus throughput. Small corpora can have files whose only rows have blank timestamps; those
+    legitimately parse to nothing.
+    """
+    artifacts = {}
+    for host, host_files in manifest["hosts"].items():
+        for record in host_files["files"]:
+            csv_path = os.path.join(corpus_dir, record["path"])
+            seconds = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                tln_df = heavymtl.parse_csv_to_tln(csv_path, 0, host, record["artifact"])
+                seconds.append(time.perf_counter() - start)
+                if tln_df is None:
+                    raise RuntimeError(f"parse_csv_to_tln failed on {csv_path} ({record['artifact']})")
+                if tln_df.empty and has_timestamps(csv_path, record["artifact"]):
+                    raise RuntimeError(f"parse_csv_to_tln returned no rows for {csv_path} ({record['artifact']}, "
+                                       f"{record['rows']} input rows with timestamps)")
+            artifact = artifacts.setdefault(record["artifact"], {"files": 0, "rows": 0, "seconds": 0.0})
+            artifact["files"] += 1
+            artifact["rows"] += record["rows"]
+            artifact["seconds"] += min(seconds)
+    for artifact in artifacts.values():
+        artifact["rows_per_sec"] = artifact["rows"] / max(artifact["seconds"], 1e-6)
+    return artifacts
+
+def benchmark_end_to_end(manifest, corpus_dir, output_type, repeat, db_url=None, extra_args=()):
+    """Time a full heavymtl.py run over the corpus (best of repeat runs) for one output type."""
+    total_rows = sum(record["rows"] for host in manifest["hosts"].values() for record in host["files"])
+    if len(manifest["hosts"]) > 1:
+        input_args = ["--case-dir", corpus_dir]
+    else:
+        host, host_files = next(iter(manifest["hosts"].items()))
+        input_args = ["-i", os.path.join(corpus_dir, host_files["input"]), "-s", host]
+    seconds = []
+    for _ in range(repeat):
+        output_dir = tempfile.mkdtemp(prefix="heavymtl_bench_")
+        command = [sys.executable, heavymtl.__file__, *input_args, "-t", output_type, "-o", output_dir, *extra_args]
+        if db_url:
+            command += ["-d", db_url]
+        try:
+            start = time.perf_counter()
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            seconds.append(time.perf_counter() - start)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+    return {"rows": total_rows, "seconds": min(seconds), "rows_per_sec": total_rows / max(min(seconds), 1e-6),
+            "args": list(extra_args)}
+
+def compare_results(results, baseline):
+    """Print each throughput next to a baseline run's, as a speedup ratio."""
+    if results["corpus"] != baseline["corpus"]:
+        print("Warning: the baseline was run on a different corpus, so the ratios are not like for like")
+    print(f"\n{'Benchmark':<48} {'Baseline':>10} {'Current':>10} {'Speedup':>8}  (rows/sec, "
+          f"{baseline.get('commit')} -> {results.get('commit')})")
+    for section in ("end_to_end", "artifacts"):
+        for name, result in results[section].items():
+            before = baseline.get(section, {}).get(name)
+            if before:
+                print(f"{name:<48} {before['rows_per_sec']:>10.0f} {result['rows_per_sec']:>10.0f} "
+                      f"{result['rows_per_sec'] / max(before['rows_per_sec'], 1e-6):>7.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic EZTools corpus and benchmark HeavyMTL on it.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Write a synthetic KAPE EZTools case covering every CSV_MAPPINGS artifact")
+    generate.add_argument("-o", "--output", required=True, help="Folder to write the corpus to")
+    generate.add_argument("-r", "--rows", type=int, default=100000, help="Total rows across all CSVs (default: 100000)")
+    generate.add_argument("--hosts", type=int, default=1,
+                          help="Number of hosts; more than one writes a --case-dir layout (default: 1)")
+    generate.add_argument("--users", nargs="+", help=f"User profiles on each host (default: {' '.join(DEFAULT_USERS)})")
+    generate.add_argument("--seed", type=int, default=0, help="Random seed; the same seed gives the same corpus (default: 0)")
+
+    run = commands.add_parser("run", help="Benchmark per-artifact parsing and end-to-end runs on a generated corpus")
+    run.add_argument("-i", "--input", required=True, help="Corpus folder written by 'generate'")
+    run.add_argument("-d", "--db-url", help="PostgreSQL URL; adds an end-to-end PostgreSQL benchmark")
+    run.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, the fastest is kept (default: 3)")
+    run.add_argument("--skip-artifacts", action="store_true", help="Only run the end-to-end benchmarks")
+    run.add_argument("--heavymtl-args", nargs=argparse.REMAINDER, default=[],
+                     help="Extra heavymtl.py arguments for the end-to-end runs (e.g. -w 4 --max-memory 2048); must be last")
+    run.add_argument("--results", help="Write the results to this JSON file")
+    run.add_argument("--compare", help="Results JSON from an earlier commit to compare against")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.command == "generate" else logging.ERROR,
+                        format="%(levelname)s - %(message)s")
+
+    if args.command == "generate":
+        start = time.perf_counter()
+        manifest = generate_corpus(args.output, args.rows, args.hosts, args.users, args.seed)
+        print(f"Wrote {args.rows} rows for {len(manifest['hosts'])} host(s) to {args.output} in "
+              f"{time.perf_counter() - start:.1f} seconds")
+        return
+
+    with open(os.path.join(args.input, CORPUS_MANIFEST), encoding="utf-8") as f:
+        manifest = json.load(f)
+    results = {
+        "commit": git_commit(),
+        "corpus": {key: manifest[key] for key in ("version", "seed", "rows", "users")} | {"hosts": len(manifest["hosts"])},
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "pyarrow": heavymtl.pyarrow.__version__ if heavymtl.pyarrow is not None else None,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count()
+        },
+        "artifacts": {} if args.skip_artifacts else benchmark_artifacts(manifest, args.input, args.repeat),
+        "end_to_end": {}
+    }
+    output_types = ["csv"] + (["postgres"] if args.db_url else [])
+    for output_type in output_types:
+        results["end_to_end"][output_type] = benchmark_end_to_end(
+            manifest, args.input, output_type, args.repeat, args.db_url if output_type == "postgres" else None,
+            args.heavymtl_args)
+
+    print(f"HeavyMTL benchmark, commit {results['commit']}, {results['corpus']['rows']} rows")
+    print(f"\n{'Artifact':<48} {'Files':>5} {'Rows':>10} {'Seconds':>8} {'Rows/sec':>10}")
+    for name, artifact in sorted(results["artifacts"].items(), key=lambda item: -item[1]["seconds"]):
+        print(f"{name:<48} {artifact['files']:>5} {artifact['rows']:>10} {artifact['seconds']:>8.2f} "
+              f"{artifact['rows_per_sec']:>10.0f}")
+    print(f"\n{'End to end':<48} {'':>5} {'Rows':>10} {'Seconds':>8} {'Rows/sec':>10}")
+    for name, result in results["end_to_end"].items():
+        print(f"{name:<48} {'':>5} {result['rows']:>10} {result['seconds']:>8.2f} {result['rows_per_sec']:>10.0f}")
+
+    if args.results:
+        with open(args.results, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.results}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare_results(results, json.load(f))
+
+if __name__ == "__main__":
+    main()
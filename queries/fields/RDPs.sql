@@ -0,0 +1,34 @@
+--- Needs a timeline loaded with --fields (EventId and Channel columns); runs on PostgreSQL and SQLite as is
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+(eventid, channel) IN (VALUES
+    /* Terminal Services / RDP Session Activity */
+    (21, 'Microsoft-Windows-TerminalServices-LocalSessionManager/Operational'), -- Remote Desktop Services: Session logon succeeded
+    (22, 'Microsoft-Windows-TerminalServices-LocalSessionManager/Operational'), -- Remote Desktop Services: Shell start notification received
+    (23, 'Microsoft-Windows-TerminalServices-LocalSessionManager/Operational'), -- Remote Desktop Services: Session logoff succeeded
+    (24, 'Microsoft-Windows-TerminalServices-LocalSessionManager/Operational'), -- Remote Desktop Services: Session has been disconnected
+    (25, 'Microsoft-Windows-TerminalServices-LocalSessionManager/Operational'), -- Remote Desktop Services: Session reconnection succeeded
+	(39, 'Microsoft-Windows-TerminalServices-LocalSessionManager/Operational'), -- Session disconnected by session manager (user or timeout)
+    (40, 'Microsoft-Windows-TerminalServices-LocalSessionManager/Operational'), -- Session disconnected by local/remote disconnect request
+    (1149, 'Microsoft-Windows-TerminalServices-RemoteConnectionManager/Operational'), -- Remote Desktop Services: User authentication succeeded
+
+    /* RDP Operational / Driver Errors */
+    (1024, 'Microsoft-Windows-TerminalServices-RDPClient/Operational'), -- RDP Client: Connection error or protocol failure
+    (1102, 'Microsoft-Windows-TerminalServices-RDPClient/Operational'), --  RDP client has initiated a multi-transport connection to a remote server
+
+    /* Logon / Logoff / Privileges */
+    (4624, 'Security'), -- An account was successfully logged on
+    (4625, 'Security'), -- An account failed to log on
+    (4634, 'Security'), -- An account was logged off
+    (4647, 'Security'), -- User initiated logoff
+    (4648, 'Security'), -- A logon was attempted using explicit credentials
+    (4672, 'Security'), -- Special privileges assigned to new logon (Admin rights)
+    
+    /* Session Reconnect / Disconnect (TS) */
+    (4778, 'Security'), -- A session was reconnected to a Window Station
+    (4779, 'Security'), -- A session was disconnected from a Window Station
+
+    /* System Events */
+    (41, 'System') -- The system shutdown unexpectedly (Power loss/Crash)
+)
+ORDER BY "time"
\ No newline at end of file
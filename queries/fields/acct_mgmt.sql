@@ -0,0 +1,35 @@
+--- Needs a timeline loaded with --fields (EventId and Channel columns); runs on PostgreSQL and SQLite as is
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+(eventid, channel) IN (VALUES
+    /* User Account Management (Security Channel) */
+    (4720, 'Security'), -- User created
+    (4722, 'Security'), -- User enabled
+    (4723, 'Security'), -- User changed password
+    (4724, 'Security'), -- User reset password
+    (4725, 'Security'), -- User disabled
+    (4726, 'Security'), -- User deleted
+    (4738, 'Security'), -- User changed (general)
+    (4740, 'Security'), -- User locked out
+    (4767, 'Security'), -- User unlocked
+    (4781, 'Security'), -- Account name changed
+
+    /* Group Management (Security Channel) */
+    (4727, 'Security'), -- Security group created
+    (4728, 'Security'), -- Member added to security group
+    (4729, 'Security'), -- Member removed from security group
+    (4730, 'Security'), -- Security group deleted
+    (4731, 'Security'), -- Local group created
+    (4732, 'Security'), -- Member added to local group
+    (4733, 'Security'), -- Member removed from local group
+    (4734, 'Security'), -- Local group deleted
+    (4735, 'Security'), -- Local group changed
+    (4737, 'Security'), -- Security group changed
+    (4754, 'Security'), -- Universal group created
+    (4755, 'Security'), -- Universal group changed
+    (4756, 'Security'), -- Member added to universal group
+    (4757, 'Security'), -- Member removed from universal group
+    (4758, 'Security'), -- Universal group deleted
+    (4764, 'Security') -- Group type changed
+)
+ORDER BY "time"
\ No newline at end of file
@@ -0,0 +1,10 @@
+--- Needs a timeline loaded with --fields (EventId and Channel columns); runs on PostgreSQL and SQLite as is
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+(eventid, channel) IN (VALUES
+    (104, 'System'), -- The System audit log was cleared (Critical System Event)
+    (104, 'Setup'), -- The Setup audit log was cleared
+    (1102, 'Security'), -- The Security audit log was cleared (Critical Security Event)
+    (4715, 'Security') -- The audit policy was changed
+)
+ORDER BY "time"
\ No newline at end of file
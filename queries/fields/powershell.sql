@@ -0,0 +1,21 @@
+--- Needs a timeline loaded with --fields (EventId and Channel columns); runs on PostgreSQL and SQLite as is
+--- Powershell & Remote Execution Artifacts
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+(eventid, channel) IN (VALUES
+    /* PowerShell Engine & Scripting */
+    (400, 'Windows PowerShell'),
+    (4104, 'Microsoft-Windows-PowerShell/Operational'),
+    (4103, 'Microsoft-Windows-PowerShell/Operational'),
+    (4688, 'Security'),
+
+    /* WinRM: Connection & Authentication */
+    (161, 'Microsoft-Windows-WinRM/Operational'), -- WinRM: Connection received from client
+    (6, 'Microsoft-Windows-WinRM/Operational'), -- WinRM: Client authentication succeeded
+    (142, 'Microsoft-Windows-WinRM/Operational'), -- WinRM: WSMan Shell created (Remote session started)
+
+    /* WinRM: Service & Listener Activity */
+    (10148, 'System'), -- WinRM service is listening for HTTP requests
+    (10149, 'System') -- WinRM service is listening for HTTPS requests
+)
+ORDER BY "time"
\ No newline at end of file
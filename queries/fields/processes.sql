@@ -0,0 +1,17 @@
+--- Needs a timeline loaded with --fields (EventId and Channel columns); runs on PostgreSQL and SQLite as is
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+(eventid, channel) IN (VALUES
+    /* Process Tracking (Security Channel) */
+    (4688, 'Security'), -- A new process has been created (Program execution)
+    (4689, 'Security'), -- A process has exited
+    (4696, 'Security'), -- A primary token was assigned to a process
+    (4698, 'Security'), -- A scheduled task was created
+    (4700, 'Security'), -- A scheduled task was enabled
+
+    /* Service & System Control (System Channel) */
+    (7036, 'System'), -- A service status was changed (Started/Stopped)
+    (7040, 'System'), -- Service start type changed
+    (7045, 'System') -- A new service was installed
+)
+ORDER BY "time"
\ No newline at end of file
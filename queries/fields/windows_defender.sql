@@ -0,0 +1,44 @@
+--- Needs a timeline loaded with --fields (EventId and Channel columns); runs on PostgreSQL and SQLite as is
+--- Disabling Windows Defender / Malware Detection
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+(eventid, channel) IN (VALUES
+	/* Malware Scanning Events */
+    (1000, 'Microsoft-Windows-Windows Defender/Operational'), -- Scan Started
+    (1001, 'Microsoft-Windows-Windows Defender/Operational'), -- Scan Completed
+    (1002, 'Microsoft-Windows-Windows Defender/Operational'), -- Scan Canceled
+    (1003, 'Microsoft-Windows-Windows Defender/Operational'), -- Scan Paused
+    (1004, 'Microsoft-Windows-Windows Defender/Operational'), -- Scan Resumed
+    (1005, 'Microsoft-Windows-Windows Defender/Operational'), -- Scan Failed
+	
+    /* Malware Detection Events */
+    (1006, 'Microsoft-Windows-Windows Defender/Operational'), -- Malware found
+    (1007, 'Microsoft-Windows-Windows Defender/Operational'), -- Malware action taken
+    (1008, 'Microsoft-Windows-Windows Defender/Operational'), -- Error taking action
+    (1015, 'Microsoft-Windows-Windows Defender/Operational'), -- Suspicious behavior detected
+    (1116, 'Microsoft-Windows-Windows Defender/Operational'), -- Malware detected
+    (1117, 'Microsoft-Windows-Windows Defender/Operational'), -- Action taken (Success)
+    (1118, 'Microsoft-Windows-Windows Defender/Operational'), -- Action taken (Failure)
+    (1119, 'Microsoft-Windows-Windows Defender/Operational'), -- Action taken (Critical Failure)
+    
+    /* Protection Failures & CFA */
+    (1127, 'Microsoft-Windows-Windows Defender/Operational'), -- Controlled Folder Access block
+    (3002, 'Microsoft-Windows-Windows Defender/Operational'), -- Real-time Protection failure
+    (3007, 'Microsoft-Windows-Windows Defender/Operational'), -- Recovery from failure
+
+    /* Tampering & Disabling (High Priority for Security) */
+    (5001, 'Microsoft-Windows-Windows Defender/Operational'), -- Real-time Protection Disabled
+    (5004, 'Microsoft-Windows-Windows Defender/Operational'), -- Configuration change
+    (5007, 'Microsoft-Windows-Windows Defender/Operational'), -- Platform configuration changed
+    (5008, 'Microsoft-Windows-Windows Defender/Operational'), -- Engine failed
+    (5010, 'Microsoft-Windows-Windows Defender/Operational'), -- Scanning disabled
+    (5012, 'Microsoft-Windows-Windows Defender/Operational'), -- Virus scanning disabled
+    (5013, 'Microsoft-Windows-Windows Defender/Operational'), -- Tamper protection block
+	
+	/* Service Control Manager (System Log) */
+	(7036, 'System'), -- Service status changed (Look for 'Microsoft Defender Antivirus Service')
+	
+	/* Registry Auditing (Security Log) */
+	(4657, 'Security') -- A registry value was modified (Look for 'DisableAntiSpyware' or 'DisableRealtimeMonitoring')
+)
+ORDER BY "time"
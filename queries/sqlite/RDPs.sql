@@ -0,0 +1,33 @@
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+rowid IN (SELECT rowid FROM master_timeline_fts WHERE master_timeline_fts MATCH
+    /* Terminal Services / RDP Session Activity */
+    '("EventId: 21," AND "Channel: Microsoft-Windows-TerminalServices-LocalSessionManager/Operational,")'   -- Remote Desktop Services: Session logon succeeded
+    || ' OR ("EventId: 22," AND "Channel: Microsoft-Windows-TerminalServices-LocalSessionManager/Operational,")'   -- Remote Desktop Services: Shell start notification received
+    || ' OR ("EventId: 23," AND "Channel: Microsoft-Windows-TerminalServices-LocalSessionManager/Operational,")'   -- Remote Desktop Services: Session logoff succeeded
+    || ' OR ("EventId: 24," AND "Channel: Microsoft-Windows-TerminalServices-LocalSessionManager/Operational,")'   -- Remote Desktop Services: Session has been disconnected
+    || ' OR ("EventId: 25," AND "Channel: Microsoft-Windows-TerminalServices-LocalSessionManager/Operational,")'   -- Remote Desktop Services: Session reconnection succeeded
+	|| ' OR ("EventId: 39," AND "Channel: Microsoft-Windows-TerminalServices-LocalSessionManager/Operational,")'   -- Session disconnected by session manager (user or timeout)
+    || ' OR ("EventId: 40," AND "Channel: Microsoft-Windows-TerminalServices-LocalSessionManager/Operational,")'   -- Session disconnected by local/remote disconnect request
+    || ' OR ("EventId: 1149," AND "Channel: Microsoft-Windows-TerminalServices-RemoteConnectionManager/Operational,")'   -- Remote Desktop Services: User authentication succeeded
+
+    /* RDP Operational / Driver Errors */
+    || ' OR ("EventId: 1024," AND "Channel: Microsoft-Windows-TerminalServices-RDPClient/Operational,")'   -- RDP Client: Connection error or protocol failure
+    || ' OR ("EventId: 1102," AND "Channel: Microsoft-Windows-TerminalServices-RDPClient/Operational,")'   --  RDP client has initiated a multi-transport connection to a remote server
+
+    /* Logon / Logoff / Privileges */
+    || ' OR ("EventId: 4624," AND "Channel: Security,")'   -- An account was successfully logged on
+    || ' OR ("EventId: 4625," AND "Channel: Security,")'   -- An account failed to log on
+    || ' OR ("EventId: 4634," AND "Channel: Security,")'   -- An account was logged off
+    || ' OR ("EventId: 4647," AND "Channel: Security,")'   -- User initiated logoff
+    || ' OR ("EventId: 4648," AND "Channel: Security,")'   -- A logon was attempted using explicit credentials
+    || ' OR ("EventId: 4672," AND "Channel: Security,")'   -- Special privileges assigned to new logon (Admin rights)
+    
+    /* Session Reconnect / Disconnect (TS) */
+    || ' OR ("EventId: 4778," AND "Channel: Security,")'   -- A session was reconnected to a Window Station
+    || ' OR ("EventId: 4779," AND "Channel: Security,")'   -- A session was disconnected from a Window Station
+
+    /* System Events */
+    || ' OR ("EventId: 41," AND "Channel: System,")'   -- The system shutdown unexpectedly (Power loss/Crash)
+)
+ORDER BY "time"
\ No newline at end of file
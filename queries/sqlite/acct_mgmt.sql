@@ -0,0 +1,34 @@
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+rowid IN (SELECT rowid FROM master_timeline_fts WHERE master_timeline_fts MATCH
+    /* User Account Management (Security Channel) */
+    '("EventId: 4720," AND "Channel: Security,")'   -- User created
+    || ' OR ("EventId: 4722," AND "Channel: Security,")'   -- User enabled
+    || ' OR ("EventId: 4723," AND "Channel: Security,")'   -- User changed password
+    || ' OR ("EventId: 4724," AND "Channel: Security,")'   -- User reset password
+    || ' OR ("EventId: 4725," AND "Channel: Security,")'   -- User disabled
+    || ' OR ("EventId: 4726," AND "Channel: Security,")'   -- User deleted
+    || ' OR ("EventId: 4738," AND "Channel: Security,")'   -- User changed (general)
+    || ' OR ("EventId: 4740," AND "Channel: Security,")'   -- User locked out
+    || ' OR ("EventId: 4767," AND "Channel: Security,")'   -- User unlocked
+    || ' OR ("EventId: 4781," AND "Channel: Security,")'   -- Account name changed
+
+    /* Group Management (Security Channel) */
+    || ' OR ("EventId: 4727," AND "Channel: Security,")'   -- Security group created
+    || ' OR ("EventId: 4728," AND "Channel: Security,")'   -- Member added to security group
+    || ' OR ("EventId: 4729," AND "Channel: Security,")'   -- Member removed from security group
+    || ' OR ("EventId: 4730," AND "Channel: Security,")'   -- Security group deleted
+    || ' OR ("EventId: 4731," AND "Channel: Security,")'   -- Local group created
+    || ' OR ("EventId: 4732," AND "Channel: Security,")'   -- Member added to local group
+    || ' OR ("EventId: 4733," AND "Channel: Security,")'   -- Member removed from local group
+    || ' OR ("EventId: 4734," AND "Channel: Security,")'   -- Local group deleted
+    || ' OR ("EventId: 4735," AND "Channel: Security,")'   -- Local group changed
+    || ' OR ("EventId: 4737," AND "Channel: Security,")'   -- Security group changed
+    || ' OR ("EventId: 4754," AND "Channel: Security,")'   -- Universal group created
+    || ' OR ("EventId: 4755," AND "Channel: Security,")'   -- Universal group changed
+    || ' OR ("EventId: 4756," AND "Channel: Security,")'   -- Member added to universal group
+    || ' OR ("EventId: 4757," AND "Channel: Security,")'   -- Member removed from universal group
+    || ' OR ("EventId: 4758," AND "Channel: Security,")'   -- Universal group deleted
+    || ' OR ("EventId: 4764," AND "Channel: Security,")'   -- Group type changed
+)
+ORDER BY "time"
\ No newline at end of file
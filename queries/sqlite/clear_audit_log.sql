@@ -0,0 +1,9 @@
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+rowid IN (SELECT rowid FROM master_timeline_fts WHERE master_timeline_fts MATCH
+    '("EventId: 104," AND "Channel: System,")'   -- The System audit log was cleared (Critical System Event)
+    || ' OR ("EventId: 104," AND "Channel: Setup,")'   -- The Setup audit log was cleared
+    || ' OR ("EventId: 1102," AND "Channel: Security,")'   -- The Security audit log was cleared (Critical Security Event)
+    || ' OR ("EventId: 4715," AND "Channel: Security,")'   -- The audit policy was changed
+)
+ORDER BY "time"
\ No newline at end of file
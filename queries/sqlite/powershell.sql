@@ -0,0 +1,20 @@
+--- Powershell & Remote Execution Artifacts
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+rowid IN (SELECT rowid FROM master_timeline_fts WHERE master_timeline_fts MATCH
+    /* PowerShell Engine & Scripting */
+    '("EventId: 400," AND "Channel: Windows PowerShell,")'
+    || ' OR ("EventId: 4104," AND "Channel: Microsoft-Windows-PowerShell/Operational,")'
+    || ' OR ("EventId: 4103," AND "Channel: Microsoft-Windows-PowerShell/Operational,")'
+    || ' OR ("EventId: 4688," AND "Channel: Security,")'
+
+    /* WinRM: Connection & Authentication */
+    || ' OR ("EventId: 161," AND "Channel: Microsoft-Windows-WinRM/Operational,")'   -- WinRM: Connection received from client
+    || ' OR ("EventId: 6," AND "Channel: Microsoft-Windows-WinRM/Operational,")'   -- WinRM: Client authentication succeeded
+    || ' OR ("EventId: 142," AND "Channel: Microsoft-Windows-WinRM/Operational,")'   -- WinRM: WSMan Shell created (Remote session started)
+
+    /* WinRM: Service & Listener Activity */
+    || ' OR ("EventId: 10148," AND "Channel: System,")'   -- WinRM service is listening for HTTP requests
+    || ' OR ("EventId: 10149," AND "Channel: System,")'   -- WinRM service is listening for HTTPS requests
+)
+ORDER BY "time"
\ No newline at end of file
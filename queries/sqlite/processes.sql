@@ -0,0 +1,16 @@
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+rowid IN (SELECT rowid FROM master_timeline_fts WHERE master_timeline_fts MATCH
+    /* Process Tracking (Security Channel) */
+    '("EventId: 4688," AND "Channel: Security,")'   -- A new process has been created (Program execution)
+    || ' OR ("EventId: 4689," AND "Channel: Security,")'   -- A process has exited
+    || ' OR ("EventId: 4696," AND "Channel: Security,")'   -- A primary token was assigned to a process
+    || ' OR ("EventId: 4698," AND "Channel: Security,")'   -- A scheduled task was created
+    || ' OR ("EventId: 4700," AND "Channel: Security,")'   -- A scheduled task was enabled
+
+    /* Service & System Control (System Channel) */
+    || ' OR ("EventId: 7036," AND "Channel: System,")'   -- A service status was changed (Started/Stopped)
+    || ' OR ("EventId: 7040," AND "Channel: System,")'   -- Service start type changed
+    || ' OR ("EventId: 7045," AND "Channel: System,")'   -- A new service was installed
+)
+ORDER BY "time"
\ No newline at end of file
@@ -0,0 +1,51 @@
+SELECT * FROM master_timeline
+WHERE ---("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+rowid IN (SELECT rowid FROM master_timeline_fts WHERE master_timeline_fts MATCH
+	'"TrackView"'
+	|| ' OR "Reptilic"'
+	|| ' OR "SpyPhone"'
+	|| ' OR "MobileTracker"'
+	|| ' OR "Cerberus"'
+	|| ' OR "Wspy"'
+	|| ' OR "Unisafe"'
+	|| ' OR "mSpy"'
+	|| ' OR "MonitorMinor"'
+	|| ' OR "KeyLog"'
+	|| ' OR "PhoneSheriff"'
+	|| ' OR "MobileSpy"'
+	|| ' OR "RetinaX"'
+	|| ' OR "Retina-X"'
+	|| ' OR "TeenShield"'
+	|| ' OR "TheTruthSpy"'
+	|| ' OR "iSpyoo"'
+	|| ' OR "PhoneSpector"'
+	|| ' OR "Spyera"'
+	|| ' OR "iKeyMonitor"'
+	|| ' OR "Mobistealth"'
+	|| ' OR "Spymie"'
+	|| ' OR "GuestSpy"'
+	|| ' OR "Spynote"'
+	|| ' OR "NeoSpy"'
+	|| ' OR "FlexiSpy"'
+	|| ' OR "Spy Master Pro"'
+	|| ' OR "SpyMasterPro"'
+	|| ' OR "SpyHuman"'
+	|| ' OR "Spyfone"'
+	|| ' OR "FamilyOrbit"'
+	|| ' OR "Family Orbit"'
+	|| ' OR "Copy9"'
+	|| ' OR "SpyBubble"'
+	|| ' OR "Android Spy"'
+	|| ' OR "AndroidSpy"'
+	|| ' OR "uMobix"'
+	|| ' OR "Catwatchful"'
+	|| ' OR "SpyX"'
+	|| ' OR "Cocospy"'
+	|| ' OR "pcTattletale"'
+	|| ' OR "Spyic"'
+	|| ' OR "Spyzie"'
+	|| ' OR "KidsGuard Pro"'
+	|| ' OR "KidsGuardPro"'
+	|| ' OR "Eyezy"'
+)
+ORDER BY "time"
@@ -0,0 +1,43 @@
+--- Disabling Windows Defender / Malware Detection
+SELECT * FROM master_timeline
+WHERE ("time" > '2025-12-01' AND "time" < '2025-12-20') AND
+rowid IN (SELECT rowid FROM master_timeline_fts WHERE master_timeline_fts MATCH
+	/* Malware Scanning Events */
+    '("EventId: 1000," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Scan Started
+    || ' OR ("EventId: 1001," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Scan Completed
+    || ' OR ("EventId: 1002," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Scan Canceled
+    || ' OR ("EventId: 1003," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Scan Paused
+    || ' OR ("EventId: 1004," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Scan Resumed
+    || ' OR ("EventId: 1005," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Scan Failed
+	
+    /* Malware Detection Events */
+    || ' OR ("EventId: 1006," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Malware found
+    || ' OR ("EventId: 1007," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Malware action taken
+    || ' OR ("EventId: 1008," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Error taking action
+    || ' OR ("EventId: 1015," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Suspicious behavior detected
+    || ' OR ("EventId: 1116," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Malware detected
+    || ' OR ("EventId: 1117," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Action taken (Success)
+    || ' OR ("EventId: 1118," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Action taken (Failure)
+    || ' OR ("EventId: 1119," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Action taken (Critical Failure)
+    
+    /* Protection Failures & CFA */
+    || ' OR ("EventId: 1127," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Controlled Folder Access block
+    || ' OR ("EventId: 3002," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Real-time Protection failure
+    || ' OR ("EventId: 3007," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Recovery from failure
+
+    /* Tampering & Disabling (High Priority for Security) */
+    || ' OR ("EventId: 5001," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Real-time Protection Disabled
+    || ' OR ("EventId: 5004," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Configuration change
+    || ' OR ("EventId: 5007," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Platform configuration changed
+    || ' OR ("EventId: 5008," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Engine failed
+    || ' OR ("EventId: 5010," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Scanning disabled
+    || ' OR ("EventId: 5012," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Virus scanning disabled
+    || ' OR ("EventId: 5013," AND "Channel: Microsoft-Windows-Windows Defender/Operational,")'   -- Tamper protection block
+	
+	/* Service Control Manager (System Log) */
+	|| ' OR ("EventId: 7036," AND "Channel: System,")'   -- Service status changed (Look for 'Microsoft Defender Antivirus Service')
+	
+	/* Registry Auditing (Security Log) */
+	|| ' OR ("EventId: 4657," AND "Channel: Security,")'   -- A registry value was modified (Look for 'DisableAntiSpyware' or 'DisableRealtimeMonitoring')
+)
+ORDER BY "time"
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# heavymtl.py and heavymtl_bench.py are scripts at the repository root, not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,128 @@
+import ntpath
+
+import numpy as np
+import pandas as pd
+
+import heavymtl
+
+PATHS = [
+    r"C:\Users\alice\NTUSER.DAT",
+    r"C:\Users\alice\NTUSER.DAT",  # Repeated, served from the memo
+    r"C:\$Recycle.Bin\S-1-5-21-1004\$IABC123.txt",
+    r"C:\Users\bob\\",  # Trailing separators
+    r"C:\Users\bob\AppData\\\UsrClass.dat",  # Separator run
+    "C:",  # Drive only
+    "C:\\",
+    r"C:NTUSER.DAT",
+    r"\\server\share\carol\NTUSER.DAT",  # UNC
+    r"\\server\share\NTUSER.DAT",
+    r"\\server\share",
+    r"\\?\UNC\server\share\dave\NTUSER.DAT",
+    "Users/erin/NTUSER.DAT",  # Forward slashes
+    "NTUSER.DAT",
+    "",
+    None,
+    np.nan,
+]
+
+BAM_KEYS = [
+    r"ROOT\ControlSet001\Services\bam\State\UserSettings\S-1-5-21-1004",
+    r"ROOT\ControlSet001\Services\bam\State\UserSettings\S-1-5-21-1004",
+    r"ROOT\ControlSet001\Services\bam\UserSettings\x\UserSettings\S-1-5-18",
+    r"ROOT\ControlSet001\Services\bam\State",
+    r"UserSettings\\",
+    "",
+    None,
+    np.nan,
+]
+
+
+def old_user_from_parent_dir(paths):
+    """The per-row derivation before vectorization, with Windows path semantics."""
+    return paths.apply(lambda path: ntpath.basename(ntpath.dirname(str(path))) if pd.notna(path) else "Unknown_User")
+
+
+def old_user_from_bam_key(paths):
+    return paths.apply(
+        lambda path: path.split("UserSettings\\")[-1] if pd.notna(path) and "UserSettings\\" in path else "Unknown_User"
+    )
+
+
+def old_srum_user(df):
+    return df.apply(
+        lambda row: f"{row.get('UserName')} ({row.get('Sid')})" if pd.notna(row.get('UserName')) and pd.notna(row.get('Sid')) else "Unknown_User",
+        axis=1
+    )
+
+
+def test_user_from_parent_dir_matches_ntpath():
+    paths = pd.Series(PATHS, dtype=object, index=range(10, 10 + len(PATHS)))
+    pd.testing.assert_series_equal(heavymtl.user_from_parent_dir(paths), old_user_from_parent_dir(paths),
+                                   check_dtype=False)
+
+
+def test_user_from_bam_key_matches_split():
+    keys = pd.Series(BAM_KEYS, dtype=object)
+    pd.testing.assert_series_equal(heavymtl.user_from_bam_key(keys), old_user_from_bam_key(keys), check_dtype=False)
+
+
+def test_user_with_sid_matches_row_apply():
+    df = pd.DataFrame({
+        "UserName": ["alice", "alice", None, "bob", np.nan, "carol"],
+        "Sid": ["S-1-5-21-1001", "S-1-5-21-1001", "S-1-5-21-1002", None, np.nan, "S-1-5-21-1003"],
+    }, index=[5, 3, 8, 1, 0, 2])
+    pd.testing.assert_series_equal(heavymtl.user_with_sid(df.get("UserName"), df.get("Sid"), df.index),
+                                   old_srum_user(df), check_dtype=False)
+
+
+def test_user_with_sid_missing_columns():
+    df = pd.DataFrame({"UserName": ["alice", "bob"]})
+    assert heavymtl.user_with_sid(df.get("UserName"), df.get("Sid"), df.index).tolist() == ["Unknown_User"] * 2
+
+
+def test_map_unique_runs_derive_once_per_distinct_value():
+    seen = []
+
+    def derive(uniques):
+        seen.append(list(uniques))
+        return uniques.str.upper()
+
+    values = pd.Series(["a", "b", "a", None, "b", "a"], index=list("uvwxyz"))
+    result = heavymtl.map_unique(values, derive)
+    assert seen == [["a", "b"]]
+    assert result.tolist() == ["A", "B", "A", "Unknown_User", "B", "A"]
+    assert list(result.index) == list("uvwxyz")
+
+
+def test_collect_sid_labels_from_srum(tmp_path):
+    srum = tmp_path / "20251220143000_SrumECmd_NetworkUsages_Output.csv"
+    pd.DataFrame({
+        "Timestamp": ["2024-01-01 10:00:00"] * 3,
+        "UserName": ["DESKTOP\\alice", None, "DESKTOP\\bob"],
+        "Sid": ["S-1-5-21-1001", "S-1-5-21-1009", "S-1-5-21-1002"],
+    }).to_csv(srum, index=False)
+
+    labels = heavymtl.collect_sid_labels([(str(srum), heavymtl.SID_SOURCE_TYPE)])
+    assert labels["S-1-5-21-1001"] == "DESKTOP\\alice (S-1-5-21-1001)"
+    assert labels["S-1-5-18"] == "SYSTEM (S-1-5-18)"
+    assert "S-1-5-21-1009" not in labels  # No UserName to name it with
+
+
+def test_bam_users_with_and_without_sid_resolution():
+    keys = pd.Series([
+        r"ROOT\bam\State\UserSettings\S-1-5-21-1001",
+        r"ROOT\bam\State\UserSettings\S-1-5-21-9999",  # Unknown SID
+        r"ROOT\bam\State\UserSettings\S-1-5-18",
+        None,
+    ], dtype=object)
+    users = heavymtl.user_from_bam_key(keys)
+    # Without --resolve-sids users stay bare SIDs
+    assert users.tolist() == ["S-1-5-21-1001", "S-1-5-21-9999", "S-1-5-18", "Unknown_User"]
+
+    labels = {"S-1-5-21-1001": "alice (S-1-5-21-1001)", "S-1-5-18": "SYSTEM (S-1-5-18)"}
+    resolved = heavymtl.resolve_sids(users, labels)
+    assert resolved.tolist() == ["alice (S-1-5-21-1001)", "S-1-5-21-9999", "SYSTEM (S-1-5-18)", "Unknown_User"]
+
+    user = heavymtl.TIMELINE_COLUMNS.index("User")
+    rows = [["t", "BamDam", "HOST", sid] + [""] * (len(heavymtl.TIMELINE_COLUMNS) - 4) for sid in users]
+    assert [row[user] for row in heavymtl.resolve_row_sids(rows, labels)] == resolved.tolist()
@@ -0,0 +1,44 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+import heavymtl
+
+
+@pytest.fixture
+def timeline():
+    return pd.DataFrame({
+        "Time": pd.date_range("2025-12-01", periods=8000, freq="min").strftime(heavymtl.TIME_FORMAT),
+        "Source": "EVTX",
+        "System": "HOST",
+        "User": "alice",
+        "Description": [f"event {i} " + "x" * 360 for i in range(8000)],
+    })
+
+
+def write_timeline(df, output_csv, compression=None, split=None):
+    with heavymtl.timeline_csv_writer(output_csv, heavymtl.TLN_COLUMNS, compression=compression, split=split) as write:
+        for start in range(0, len(df), heavymtl.CSV_CHUNK_ROWS):
+            write(df.iloc[start:start + heavymtl.CSV_CHUNK_ROWS])
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_size_split_parts_stay_under_the_limit(tmp_path, timeline, compression):
+    (tmp_path / "whole").mkdir()
+    write_timeline(timeline, str(tmp_path / "whole" / "master_timeline.csv"), compression)
+    write_timeline(timeline, str(tmp_path / "master_timeline.csv"), compression, split=1)
+
+    parts = sorted(glob.glob(str(tmp_path / "master_timeline_*.csv*")))
+    sizes = [os.path.getsize(path) for path in parts]
+    limit = 1024 * 1024
+    assert all(size <= limit for size in sizes)
+    # Every part but the last ends within one chunk of the limit
+    chunk_bytes = limit // heavymtl.CSV_SPLIT_CHUNKS
+    assert all(size > limit - 2 * chunk_bytes for size in sizes[:-1])
+
+    whole = pd.read_csv(tmp_path / "whole" / os.path.basename(heavymtl.csv_part_path("master_timeline.csv", compression)))
+    split = pd.concat([pd.read_csv(path) for path in parts], ignore_index=True)
+    pd.testing.assert_frame_equal(split, whole)
+    assert len(whole) == len(timeline)
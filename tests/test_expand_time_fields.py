@@ -0,0 +1,59 @@
+import pandas as pd
+
+import heavymtl
+
+MFT_FIELDS = [
+    ("Created0x10", "C1"),
+    ("Created0x30", "C3"),
+    ("LastModified0x10", "M1"),
+    ("LastAccess0x10", "A1"),
+]
+
+
+def iterrows_expansion(df, field_names, field_prefixes):
+    """The row-by-row expansion parse_csv_to_tln used before it was vectorized."""
+    for field in field_names:
+        df[field + "_formatted"] = pd.to_datetime(df[field], errors="coerce").dt.strftime("%Y-%m-%d %H:%M:%S")
+    grouped_times = []
+    for _, row in df.iterrows():
+        times = [(row[field + "_formatted"], field) for field in field_names if pd.notna(row[field + "_formatted"])]
+        time_dict = {}
+        for t, field in times:
+            time_dict.setdefault(t, []).append(field)
+        for t, fields in time_dict.items():
+            prefix_str = f"[{''.join(sorted(field_prefixes.get(field, '') for field in fields))}]"
+            new_row = row.copy()
+            new_row["Time"] = t
+            new_row["Description"] = f"{prefix_str} {row['BaseDescription']}" if row["BaseDescription"] else prefix_str
+            grouped_times.append(new_row)
+    return pd.DataFrame(grouped_times)[heavymtl.TLN_COLUMNS].reset_index(drop=True)
+
+
+def test_expand_time_fields_matches_iterrows():
+    df = pd.DataFrame({
+        # Shared datetimes, sub-second differences, missing values and a row without any timestamp
+        "Created0x10": ["2024-01-01 10:00:00.1000000", "2024-01-02 09:00:00.0000000", None, "2024-01-04 00:00:00.0000000",
+                        None],
+        "Created0x30": ["2024-01-01 10:00:00.9000000", "2024-01-02 08:00:00.0000000", "2024-01-03 12:00:00.0000000",
+                        "2024-01-04 00:00:00.0000000", None],
+        "LastModified0x10": ["2024-01-05 10:00:00.0000000", "2024-01-02 09:00:00.5000000", None,
+                             "2024-01-04 00:00:00.0000000", None],
+        "LastAccess0x10": ["2024-01-01 10:00:00.0000000", "bad value", "2024-01-03 12:00:00.0000000",
+                           "2024-01-06 00:00:00.0000000", None],
+        "Source": "$MFT",
+        "System": "Unknown_System",
+        "User": ["alice", "bob", "carol", "dave", "erin"],
+        "BaseDescription": ["FileName: a.txt", "FileName: b.txt, InUse: True", "", "FileName: d.exe", "FileName: e"],
+    })
+    field_names = [field for field, _ in MFT_FIELDS]
+    field_prefixes = dict(MFT_FIELDS)
+
+    expected = iterrows_expansion(df.copy(), field_names, field_prefixes)
+
+    times = pd.DataFrame({field: heavymtl.parse_timestamps(df[field], "%Y-%m-%d %H:%M:%S.%f") for field in field_names}, index=df.index)
+    actual = heavymtl.expand_time_fields(df, times, field_prefixes)[heavymtl.TLN_COLUMNS].reset_index(drop=True)
+    actual["Time"] = actual["Time"].dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    pd.testing.assert_frame_equal(actual.astype(object), expected.astype(object))
+    assert actual["Description"].tolist()[:3] == ["[A1C1C3] FileName: a.txt", "[M1] FileName: a.txt",
+                                                  "[C1M1] FileName: b.txt, InUse: True"]
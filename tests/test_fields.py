@@ -0,0 +1,27 @@
+import pandas as pd
+
+import heavymtl
+
+PREFETCH_TYPE = "*_PECmd_Output.csv"
+
+
+def prefetch_frame():
+    return pd.DataFrame({
+        "LastRun": ["2024-01-01 10:00:00", "2024-01-02 11:00:00"],
+        "Volume0Name": ["HOST", "HOST"],
+        "UserName": ["alice", "bob"],
+        "ExecutableName": ["CMD.EXE", "POWERSHELL.EXE"],
+        "RunCount": ["3", "1"],
+    })
+
+
+def test_frame_to_tln_without_fields_carries_tln_columns_only():
+    tln_df = heavymtl.frame_to_tln(prefetch_frame(), "x_PECmd_Output.csv", PREFETCH_TYPE, 0, "HOST")
+    assert list(tln_df.columns) == heavymtl.TLN_COLUMNS
+
+
+def test_frame_to_tln_with_fields_adds_field_columns():
+    tln_df = heavymtl.frame_to_tln(prefetch_frame(), "x_PECmd_Output.csv", PREFETCH_TYPE, 0, "HOST", fields=True)
+    assert list(tln_df.columns) == heavymtl.TIMELINE_COLUMNS
+    assert tln_df["ExecutableName"].tolist() == ["CMD.EXE", "POWERSHELL.EXE"]
+    assert tln_df["EventId"].isna().all()
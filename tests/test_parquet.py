@@ -0,0 +1,89 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+import heavymtl
+
+pytestmark = pytest.mark.skipif(heavymtl.pyarrow is None, reason="pyarrow not installed")
+
+
+def timeline(times, sources):
+    return pd.DataFrame({
+        "Time": pd.to_datetime(times),
+        "Source": pd.Categorical(sources, categories=["EVTX", "$MFT", "Unused"]),
+        "System": pd.Categorical(["HOST"] * len(times), categories=["HOST", "OTHER"]),
+        "User": pd.Categorical(["alice"] * len(times)),
+        "Description": [f"event {i}" for i in range(len(times))],
+    })
+
+
+@pytest.fixture
+def two_months():
+    november = [f"2025-11-{day:02d} 10:00:00" for day in range(1, 11)]
+    december = [f"2025-12-{day:02d} 10:00:00" for day in range(1, 4)]
+    sources = ["EVTX", "$MFT"] * 5 + ["EVTX"] * 3
+    return timeline(november + december, sources)
+
+
+def write_in_chunks(df, output_dir, rows=3):
+    # Streamed in small chunks that straddle the month boundary
+    with heavymtl.parquet_timeline_writer(output_dir) as write:
+        for start in range(0, len(df), rows):
+            write(df.iloc[start:start + rows])
+
+
+def row_groups(path):
+    metadata = heavymtl.pyarrow_parquet.ParquetFile(path).metadata
+    return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+
+def read_sorted(output_dir, **kwargs):
+    return pd.read_parquet(output_dir, **kwargs).sort_values("Time", ignore_index=True)
+
+
+def test_one_file_per_month_and_source_with_full_row_groups(tmp_path, monkeypatch, two_months):
+    monkeypatch.setattr(heavymtl, "PARQUET_ROW_GROUP_ROWS", 2)
+    output_dir = str(tmp_path / "master_timeline.parquet")
+    write_in_chunks(two_months, output_dir)
+
+    files = sorted(glob.glob(os.path.join(output_dir, "*", "*", "*.parquet")))
+    assert [os.path.relpath(os.path.dirname(path), output_dir) for path in files] == [
+        os.path.join("Month=2025-11", "Source=$MFT"),
+        os.path.join("Month=2025-11", "Source=EVTX"),
+        os.path.join("Month=2025-12", "Source=EVTX"),
+    ]
+    assert [row_groups(path) for path in files] == [[2, 2, 1], [2, 2, 1], [2, 1]]
+
+    result = read_sorted(output_dir)
+    assert result["Time"].tolist() == two_months["Time"].tolist()
+    assert result["Source"].astype(str).tolist() == two_months["Source"].astype(str).tolist()
+    assert result["Description"].tolist() == two_months["Description"].tolist()
+    # Only the categories the rows use are stored
+    assert heavymtl.pyarrow_parquet.read_table(files[0])["System"].chunk(0).dictionary.to_pylist() == ["HOST"]
+
+
+def test_source_filter_reads_only_that_sources_files(tmp_path, two_months):
+    import pyarrow.dataset
+
+    output_dir = str(tmp_path / "master_timeline.parquet")
+    write_in_chunks(two_months, output_dir)
+
+    dataset = pyarrow.dataset.dataset(output_dir, partitioning="hive")
+    evtx = pyarrow.dataset.field("Source") == "EVTX"
+    assert len(list(dataset.get_fragments(filter=evtx))) == 2
+    assert len(list(dataset.get_fragments())) == 3
+
+    result = read_sorted(output_dir, filters=[("Source", "=", "$MFT")])
+    assert result["Description"].tolist() == [f"event {i}" for i in range(1, 10, 2)]
+
+
+def test_buffered_rows_are_bounded_across_sources(tmp_path, monkeypatch, two_months):
+    monkeypatch.setattr(heavymtl, "PARQUET_BUFFER_ROWS", 4)
+    output_dir = str(tmp_path / "master_timeline.parquet")
+    write_in_chunks(two_months, output_dir, rows=2)
+
+    november = sorted(glob.glob(os.path.join(output_dir, "Month=2025-11", "*", "*.parquet")))
+    assert all(len(row_groups(path)) > 1 for path in november)
+    assert read_sorted(output_dir)["Description"].tolist() == two_months["Description"].tolist()
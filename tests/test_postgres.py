@@ -0,0 +1,130 @@
+import re
+
+import pandas as pd
+
+import heavymtl
+
+
+def test_case_table_names_are_distinct_per_case_id():
+    case_ids = ["Case-1", "case_1", "CASE 1", "case 1", "x" * 40 + "a", "x" * 40 + "b"]
+    names = [heavymtl.postgres_case_table(case_id) for case_id in case_ids]
+    assert len(set(names)) == len(case_ids)
+    assert heavymtl.postgres_case_table("Case-1") == heavymtl.postgres_case_table("Case-1")
+    assert heavymtl.postgres_case_table() == "master_timeline_default"
+
+
+def test_case_table_names_are_valid_identifiers():
+    for case_id in ["Case-1", "ACME Corp / Incident #42 (2025)", "x" * 200, "Ünïcødé" * 10]:
+        name = heavymtl.postgres_case_table(case_id)
+        assert re.fullmatch(r"\w+", name)
+        # Monthly partitions append _YYYY_MM and must still fit in 63 bytes
+        assert len(f"{name}_2025_12".encode()) <= 63
+
+
+class RecordingCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.log = conn.log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.log.append(" ".join(sql.split()))
+
+    def fetchone(self):
+        return (self.conn.has_rows,)
+
+    def copy_expert(self, sql, buffer):
+        self.log.append(sql)
+        self.conn.copied.append(buffer.read())
+
+
+class RecordingConnection:
+    def __init__(self, has_rows=False):
+        self.log = []
+        self.copied = []
+        self.has_rows = has_rows
+
+    def cursor(self):
+        return RecordingCursor(self)
+
+    def commit(self):
+        self.log.append("COMMIT")
+
+    def rollback(self):
+        self.log.append("ROLLBACK")
+
+
+def time_index(log):
+    return next(sql for sql in log if "_time ON" in sql)
+
+
+def test_time_index_is_brin_only_for_time_ordered_loads():
+    conn = RecordingConnection()
+    heavymtl.index_postgres_table(conn, "master_timeline_default")
+    assert "USING BRIN (Time)" in time_index(conn.log)
+
+    conn = RecordingConnection()
+    heavymtl.index_postgres_table(conn, "master_timeline_default", time_ordered=False)
+    assert "USING BTREE (Time)" in time_index(conn.log)
+
+
+def staged_load(conn):
+    df = pd.DataFrame({
+        "Time": ["2025-12-01 10:00:00", "2025-12-01 10:00:01"],
+        "Source": ["EVTX", "$MFT"],
+        "System": ["HOST", "HOST"],
+        "User": ["alice", ""],
+        "Description": ["logon", "file created"],
+    })
+    table = heavymtl.create_staging_table(conn)
+    heavymtl.insert_to_postgres(conn, df, batch_rows=1, table=table)
+    heavymtl.publish_staging_table(conn, table)
+    return table
+
+
+def test_staging_tables_are_unique_per_run():
+    conn = RecordingConnection()
+    tables = {heavymtl.create_staging_table(conn) for _ in range(3)}
+    assert len(tables) == 3
+    assert all(table.startswith(heavymtl.STAGING_TABLE + "_") for table in tables)
+    assert not any("DROP" in sql for sql in conn.log)
+
+
+def test_staged_load_swaps_into_an_empty_master_timeline():
+    conn = RecordingConnection(has_rows=False)
+    table = staged_load(conn)
+    assert conn.log == [
+        f"CREATE UNLOGGED TABLE {table} (LIKE master_timeline INCLUDING ALL);",
+        "COMMIT",
+        f'COPY {table} (Time, Source, System, "User", Description) FROM STDIN WITH (FORMAT csv)',
+        f'COPY {table} (Time, Source, System, "User", Description) FROM STDIN WITH (FORMAT csv)',
+        "COMMIT",
+        "SELECT pg_advisory_xact_lock(hashtext('master_timeline'));",
+        "SELECT EXISTS (SELECT 1 FROM master_timeline);",
+        "DROP TABLE master_timeline;",
+        f"ALTER TABLE {table} SET LOGGED;",
+        f"ALTER TABLE {table} RENAME TO master_timeline;",
+        "COMMIT",
+    ]
+    assert conn.copied == [
+        "2025-12-01 10:00:00,EVTX,HOST,alice,logon\n",
+        "2025-12-01 10:00:01,$MFT,HOST,,file created\n",
+    ]
+
+
+def test_staged_load_appends_to_a_populated_master_timeline():
+    conn = RecordingConnection(has_rows=True)
+    table = staged_load(conn)
+    publish = conn.log[conn.log.index("COMMIT", 4) + 1:]
+    assert publish == [
+        "SELECT pg_advisory_xact_lock(hashtext('master_timeline'));",
+        "SELECT EXISTS (SELECT 1 FROM master_timeline);",
+        f"INSERT INTO master_timeline SELECT * FROM {table};",
+        f"DROP TABLE {table};",
+        "COMMIT",
+    ]
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import heavymtl
+
+
+def test_stage_peaks_are_per_stage():
+    if heavymtl.peak_memory_since(heavymtl.memory_mark()) is None:
+        pytest.skip("resident memory high-water mark can't be reset on this platform")
+    stages = {}
+    lap = heavymtl.stage_timer(stages)
+
+    block = np.ones(200 * 1024 * 1024, dtype=np.uint8)  # 200 MB, touched so it's resident
+    del block
+    lap("big")
+    small = np.ones(1024, dtype=np.uint8)
+    del small
+    lap("small")
+
+    assert stages["big"]["peak_rss_mb"] > stages["small"]["peak_rss_mb"] + 150
+    assert heavymtl.peak_memory_mb() >= stages["big"]["peak_rss_mb"]
+
+
+def test_nested_interval_sees_inner_peaks():
+    if heavymtl.peak_memory_since(heavymtl.memory_mark()) is None:
+        pytest.skip("resident memory high-water mark can't be reset on this platform")
+    outer = heavymtl.memory_mark()
+    inner = heavymtl.stage_timer({})
+    block = np.ones(200 * 1024 * 1024, dtype=np.uint8)
+    del block
+    inner("allocate")  # Resets the high-water mark inside the outer interval
+    baseline = heavymtl.current_rss_mb()
+    assert heavymtl.peak_memory_since(outer) > baseline + 150
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+import heavymtl
+
+PREFETCH_HEADER = "LastRun,Volume0Name,UserName,ExecutableName,RunCount\n"
+
+
+@pytest.fixture
+def window(tmp_path):
+    stats_dir = tmp_path / "filters"
+    stats_dir.mkdir()
+    return pd.Timestamp("2025-11-05"), None, set(), set(), str(stats_dir)
+
+
+def write_csv(folder, text):
+    path = folder / "20251220143000_PECmd_Output.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_header_only_csv_in_a_time_window_is_skipped(tmp_path, window):
+    csv_path = write_csv(tmp_path, PREFETCH_HEADER)
+    assert heavymtl.parse_csv_to_tln(csv_path, 0, "HOST", filters=window) is None
+
+
+def test_csv_with_no_rows_in_the_window_is_skipped(tmp_path, window):
+    csv_path = write_csv(tmp_path, PREFETCH_HEADER + "2024-01-01 10:00:00,HOST,alice,CMD.EXE,3\n")
+    assert heavymtl.parse_csv_to_tln(csv_path, 0, "HOST", filters=window) is None
+
+
+def test_header_only_csv_does_not_break_the_windowed_timeline(tmp_path, window):
+    empty_dir = tmp_path / "empty"
+    empty_dir.mkdir()
+    rows_dir = tmp_path / "rows"
+    rows_dir.mkdir()
+    frames = [
+        heavymtl.parse_csv_to_tln(write_csv(empty_dir, PREFETCH_HEADER), 0, "HOST", filters=window),
+        heavymtl.parse_csv_to_tln(write_csv(rows_dir, PREFETCH_HEADER + "2025-12-01 10:00:00,HOST,alice,CMD.EXE,3\n"),
+                                  0, "HOST", filters=window),
+    ]
+    master_df = heavymtl.concat_timelines([frame for frame in frames if frame is not None])
+    assert master_df["Time"].tolist() == [pd.Timestamp("2025-12-01 10:00:00")]
@@ -0,0 +1,31 @@
+import pandas as pd
+
+import heavymtl
+
+
+def test_parse_timestamps_mixes_eztools_and_offset_values():
+    values = pd.Series([
+        "2024-01-01 10:00:00.1234567",  # EZTools format
+        "2024-01-01T10:00:00+00:00",
+        "2024-01-02T10:00:00Z",
+        "2024-01-03T12:30:00+02:00",
+        None,
+        "not a time",
+    ], name="TimeCreated")
+
+    parsed = heavymtl.parse_timestamps(values, "%Y-%m-%d %H:%M:%S.%f")
+
+    assert parsed.dt.tz is None
+    assert parsed.tolist()[:4] == [
+        pd.Timestamp("2024-01-01 10:00:00"),
+        pd.Timestamp("2024-01-01 10:00:00"),
+        pd.Timestamp("2024-01-02 10:00:00"),
+        pd.Timestamp("2024-01-03 10:30:00"),
+    ]
+    assert parsed[4:].isna().all()
+
+
+def test_parse_timestamps_iso_offsets_only():
+    values = pd.Series(["2024-05-01T08:00:00Z", "2024-05-01 09:15:30.5+00:00"], name="UpdateTimestamp")
+    parsed = heavymtl.parse_timestamps(values)
+    assert parsed.tolist() == [pd.Timestamp("2024-05-01 08:00:00"), pd.Timestamp("2024-05-01 09:15:30")]